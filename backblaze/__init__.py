@@ -1,13 +1,17 @@
 import sys
 import asyncio
+import logging
 import threading
-import time
 
+from contextlib import suppress
+from functools import partial
 from httpx import AsyncClient, Client
 from typing import Generator, AsyncGenerator, Tuple, cast
 from random import randint
+from weakref import WeakValueDictionary, finalize, ref
 
 from .base import Base
+from ._shared import get_async_client, release_async_client
 
 from .models.auth import AuthModel
 from .models.bucket import BucketModel
@@ -26,25 +30,86 @@ from .settings import BucketSettings, KeySettings, DownloadSettings
 
 from .decorators import authorize_required
 
+from .utils import json_loads
+
 
 class Awaiting(Base, AwaitingHTTP):
-    def __init__(self, *args, **kwargs) -> None:
+    _bucket_cache: "WeakValueDictionary[str, AwaitingBucket]"
+
+    def __init__(self, *args, share_client: bool = False,
+                 **kwargs) -> None:
+        """Used to interact with B2 account asynchronously.
+
+        Parameters
+        ----------
+        share_client : bool, optional
+            Used to share one connection pool between every Awaiting
+            client created with share_client, by default False
+
+        Notes
+        -----
+        Other parameters are the same as Base.
+
+        A shared pool is created with the settings of the first client
+        to use it & is closed once every client sharing it is closed.
+        """
+
         if not sys.version_info[1] >= 7:
             sys.exit("Python 3.7 & above is required.")
 
         super().__init__(*args, **kwargs)
 
-        self._client = AsyncClient(
-            timeout=self._timeout,
-            limits=self._limits,
-            headers={"User-Agent": self._user_agent}
+        client_kwargs = {
+            "http2": self._http2,
+            "timeout": self._timeout,
+            "limits": self._limits,
+            "headers": {"User-Agent": self._user_agent}
+        }
+
+        self._share_client = share_client
+        self._released = False
+        if share_client:
+            self._client = get_async_client(**client_kwargs)
+        else:
+            self._client = AsyncClient(**client_kwargs)
+
+        self._bucket_cache = WeakValueDictionary()
+
+        self._do_authorize = partial(
+            self._client.get, self._auth_url, auth=self._auth
         )
+        self._auth_header = None
+        self._refresh_task = None
+
+    async def __aenter__(self) -> "Awaiting":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
 
     async def close(self) -> None:
         """Closes any underlying TCP sessions.
         """
 
-        await self._client.aclose()
+        try:
+            if self._refresh_task:
+                self._refresh_task.cancel()
+
+                # Waited on so the refresh can't fire after closing,
+                # a refresh what already failed shouldn't stop closing.
+                with suppress(asyncio.CancelledError, Exception):
+                    await self._refresh_task
+
+                self._refresh_task = None
+        finally:
+            if self._share_client:
+                # Only released once so closing twice can't close
+                # the pool under other clients.
+                if not self._released:
+                    self._released = True
+                    await release_async_client()
+            else:
+                await self._client.aclose()
 
     @authorize_required
     async def download_by_name(self, bucket_name: str, file_name: str,
@@ -196,7 +261,7 @@ class Awaiting(Base, AwaitingHTTP):
             cast(
                 dict,
                 await self._post(
-                    url=self._routes.bucket.create,
+                    url=self._create_bucket_url,
                     json=settings.payload
                 )
             )
@@ -221,12 +286,17 @@ class Awaiting(Base, AwaitingHTTP):
             Holds details on bucket.
         AwaitingBucket
             Used for interacting with bucket.
+
+        Notes
+        -----
+        B2 returns every bucket in a single response, so no
+        pagination is needed.
         """
 
         data = cast(
             dict,
             await self._post(
-                url=self._routes.bucket.list,
+                url=self._list_buckets_url,
                 json={"bucketTypes": types}
             )
         )
@@ -247,18 +317,31 @@ class Awaiting(Base, AwaitingHTTP):
         AwaitingBucket
         """
 
-        return AwaitingBucket(self, bucket_id)
+        bucket = self._bucket_cache.get(bucket_id)
+        if bucket is None:
+            bucket = AwaitingBucket(self, bucket_id)
+            self._bucket_cache[bucket_id] = bucket
+
+        return bucket
 
     async def __authorize_background(self) -> None:
         """Used to refresh auth tokens every 23.5 hours.
         """
 
-        self._running_task = True
-        await asyncio.sleep(self._refresh_seconds + randint(0, 1500))
-        self._running_task = False
+        delay = self._refresh_seconds + randint(0, 1500)
 
-        await self.authorize()
-        self._check_cache()
+        while True:
+            await asyncio.sleep(delay)
+
+            try:
+                await self.authorize()
+            except Exception:
+                # Retried sooner so the token doesn't expire.
+                logging.exception("Failed to refresh authorization")
+                delay = self._refresh_retry_seconds
+            else:
+                self._check_cache()
+                delay = self._refresh_seconds + randint(0, 1500)
 
     async def authorize(self) -> AuthModel:
         """Used to authorize B2 account.
@@ -269,10 +352,10 @@ class Awaiting(Base, AwaitingHTTP):
             Holds data on account auth.
         """
 
-        resp = await self._client.get(url=self._auth_url, auth=self._auth)
+        resp = await self._do_authorize()
         resp.raise_for_status()
 
-        data = AuthModel(resp.json())
+        data = AuthModel(json_loads(resp.read()))
 
         self.account_id = data.account_id
 
@@ -281,28 +364,55 @@ class Awaiting(Base, AwaitingHTTP):
             data.download_url
         )
 
-        self._client.headers["Authorization"] = data.authorization_token
+        if data.authorization_token != self._auth_header:
+            self._auth_header = data.authorization_token
 
-        if not self._running_task:
-            asyncio.create_task(self.__authorize_background())
+            # A shared client is used by other accounts, so the
+            # token is added per request instead.
+            if not self._share_client:
+                self._client.headers["Authorization"] = self._auth_header
+
+        if not self._refresh_task or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(
+                self.__authorize_background()
+            )
 
         return data
 
 
 class Blocking(Base, BlockingHTTP):
+    _bucket_cache: "WeakValueDictionary[str, BlockingBucket]"
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
 
         self._client = Client(
+            http2=self._http2,
             timeout=self._timeout,
             limits=self._limits,
             headers={"User-Agent": self._user_agent}
         )
 
+        self._bucket_cache = WeakValueDictionary()
+
+        self._closed = threading.Event()
+        self._auth_thread = None
+
+    def __enter__(self) -> "Blocking":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
     def close(self) -> None:
         """Closes any underlying TCP sessions.
         """
 
+        self._closed.set()
+        if self._auth_thread and \
+                self._auth_thread is not threading.current_thread():
+            self._auth_thread.join()
+
         self._client.close()
 
     @authorize_required
@@ -448,7 +558,7 @@ class Blocking(Base, BlockingHTTP):
             cast(
                 dict,
                 self._post(
-                    url=self._routes.bucket.create,
+                    url=self._create_bucket_url,
                     json=settings.payload,
                 )
             )
@@ -472,12 +582,17 @@ class Blocking(Base, BlockingHTTP):
             Holds details on bucket.
         BlockingBucket
             Used for interacting with bucket.
+
+        Notes
+        -----
+        B2 returns every bucket in a single response, so no
+        pagination is needed.
         """
 
         data = cast(
             dict,
             self._post(
-                url=self._routes.bucket.list,
+                url=self._list_buckets_url,
                 json={"bucketTypes": types}
             )
         )
@@ -498,18 +613,45 @@ class Blocking(Base, BlockingHTTP):
         BlockingBucket
         """
 
-        return BlockingBucket(self, bucket_id)
+        bucket = self._bucket_cache.get(bucket_id)
+        if bucket is None:
+            bucket = BlockingBucket(self, bucket_id)
+            self._bucket_cache[bucket_id] = bucket
 
-    def __authorize_background(self) -> None:
-        """Used to refresh auth tokens every 23.5 hours.
+        return bucket
+
+    @staticmethod
+    def __authorize_background(client_ref: "ref[Blocking]",
+                               closed: threading.Event,
+                               delay: float) -> None:
+        """Used to refresh auth tokens every 23.5 hours until closed.
+
+        Parameters
+        ----------
+        client_ref : ref[Blocking]
+            Weak reference so an unclosed client can still be
+            garbage collected, the thread stops once it is.
+        closed : threading.Event
+        delay : float
+            Seconds until the first refresh.
         """
 
-        self._running_task = True
-        time.sleep(self._refresh_seconds + randint(0, 1500))
-        self._running_task = False
+        while not closed.wait(delay):
+            client = client_ref()
+            if client is None:
+                return
+
+            try:
+                client.authorize()
+            except Exception:
+                # Retried sooner so the token doesn't expire.
+                logging.exception("Failed to refresh authorization")
+                delay = client._refresh_retry_seconds
+            else:
+                client._check_cache()
+                delay = client._refresh_seconds + randint(0, 1500)
 
-        self.authorize()
-        self._check_cache()
+            del client
 
     def authorize(self) -> AuthModel:
         """Used to authorize B2 account.
@@ -523,7 +665,7 @@ class Blocking(Base, BlockingHTTP):
         resp = self._client.get(self._auth_url, auth=self._auth)
         resp.raise_for_status()
 
-        data = AuthModel(resp.json())
+        data = AuthModel(json_loads(resp.read()))
 
         self.account_id = data.account_id
 
@@ -535,6 +677,20 @@ class Blocking(Base, BlockingHTTP):
         self._client.headers["Authorization"] = data.authorization_token
 
         if not self._running_task:
-            threading.Thread(target=self.__authorize_background)
+            self._running_task = True
+
+            self._auth_thread = threading.Thread(
+                target=self.__authorize_background,
+                args=(
+                    ref(self),
+                    self._closed,
+                    self._refresh_seconds + randint(0, 1500)
+                ),
+                daemon=True
+            )
+            self._auth_thread.start()
+
+            # Wakes the thread if the client is collected unclosed.
+            finalize(self, self._closed.set)
 
         return data
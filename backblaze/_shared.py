@@ -0,0 +1,45 @@
+from typing import Optional
+from httpx import AsyncClient
+
+
+class SharedClient:
+    client: Optional[AsyncClient] = None
+    references: int = 0
+
+
+def get_async_client(**kwargs) -> AsyncClient:
+    """Used to get the process wide AsyncClient, creating it if needed.
+
+    Parameters
+    ----------
+    **kwargs
+        Passed to AsyncClient, only used when the client is created.
+
+    Returns
+    -------
+    AsyncClient
+    """
+
+    if SharedClient.client is None or SharedClient.client.is_closed:
+        SharedClient.client = AsyncClient(**kwargs)
+        SharedClient.references = 0
+
+    SharedClient.references += 1
+
+    return SharedClient.client
+
+
+async def release_async_client() -> None:
+    """Used to release a reference to the shared AsyncClient,
+    the client is closed once nothing references it.
+    """
+
+    SharedClient.references -= 1
+
+    if SharedClient.references <= 0 and SharedClient.client is not None:
+        client = SharedClient.client
+
+        SharedClient.client = None
+        SharedClient.references = 0
+
+        await client.aclose()
@@ -1,5 +1,5 @@
 from sys import version_info
-from httpx import BasicAuth, Limits
+from httpx import BasicAuth, Limits, Timeout
 from datetime import datetime
 
 from .routes import (
@@ -32,6 +32,7 @@ class Routes:
 class Base:
     _auth_url = "https://api.backblazeb2.com/b2api/v2/b2_authorize_account"
     _refresh_seconds = 82800
+    _refresh_retry_seconds = 60
 
     __api_routes = [
         BucketRoute,
@@ -45,7 +46,14 @@ class Base:
     ]
 
     def __init__(self, key_id: str, key: str, timeout: int = 30,
-                 chunk_size: int = 5000024) -> None:
+                 chunk_size: int = 5000024,
+                 max_concurrent_parts: int = 10,
+                 max_connections: int = 128,
+                 max_keepalive_connections: int = 64,
+                 keepalive_expiry: float = 60.0,
+                 connect_timeout: float = 10.0,
+                 http2: bool = True,
+                 compress_requests: bool = False) -> None:
         """Used to interact with B2 account.
 
         Parameters
@@ -58,6 +66,21 @@ class Base:
             Max time a request can take, by default 30
         chunk_size : int, optional
             File reading chunk size, must be above 5mb, by default 5000024
+        max_concurrent_parts : int, optional
+            Max parts uploaded at once when uploading a file
+            in parts, by default 10
+        max_connections : int, optional
+            Max connections in the pool, by default 128
+        max_keepalive_connections : int, optional
+            Max idle connections kept alive, by default 64
+        keepalive_expiry : float, optional
+            Seconds an idle connection is kept alive for, by default 60.0
+        connect_timeout : float, optional
+            Max time establishing a connection can take, by default 10.0
+        http2 : bool, optional
+            Used to enable HTTP/2, by default True
+        compress_requests : bool, optional
+            Used to gzip large JSON request bodies, by default False
 
         Notes
         -----
@@ -67,6 +90,9 @@ class Base:
 
         The authorize could take another X amount of seconds and then the
         reissued request could take another X amount of seconds.
+
+        The connection pool is only released once close is called,
+        the client can also be used as a context manager to do this.
         """
 
         self._auth = BasicAuth(
@@ -74,17 +100,21 @@ class Base:
             key
         )
 
-        self._timeout = timeout
+        self._timeout = Timeout(timeout, connect=connect_timeout)
         self._limits = Limits(
-            max_connections=None,
-            max_keepalive_connections=None
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
         )
+        self._http2 = http2
+        self._compress_requests = compress_requests
         self._user_agent = (
             "backblaze/{0}+python/{1.major}.{1.minor}.{1.micro}".format(
                 __version__, version_info
             )
         )
         self.chunk_size = chunk_size
+        self.max_concurrent_parts = max_concurrent_parts
 
         self._routes = Routes()
         self._running_task = False
@@ -105,6 +135,13 @@ class Base:
         self.__format_route(api_url, self.__api_routes)
         self.__format_route(download_url, self.__download_routes)
 
+        # Bound once for routes used on hot paths.
+        self._create_bucket_url = self._routes.bucket.create
+        self._list_buckets_url = self._routes.bucket.list
+        self._list_parts_url = self._routes.file.list_parts
+        self._copy_part_url = self._routes.file.copy_part
+        self._finish_large_url = self._routes.file.finish_large
+
     def _check_cache(self) -> None:
         """Checks upload_parts_urls & upload_urls for any
         expired URls. This is mainly for upload_parts_urls what
@@ -1,7 +1,6 @@
 import os
 import aiofiles
 
-from hashlib import sha1
 from typing import AsyncGenerator, Tuple, TYPE_CHECKING, cast
 
 from ..base import BaseBucket
@@ -22,11 +21,15 @@ from ...utils import UploadUrlCache
 
 from ...decorators import authorize_required
 
+from ...hash import sha1_hex
+
 if TYPE_CHECKING:
     from ... import Awaiting
 
 
 class AwaitingBucket(BaseBucket):
+    __slots__ = ()
+
     _context: "Awaiting"
 
     @authorize_required
@@ -241,7 +244,7 @@ class AwaitingBucket(BaseBucket):
             url=upload.upload_url,
             headers={
                 "Content-Length": str(len(data)),
-                "X-Bz-Content-Sha1": sha1(data).hexdigest(),
+                "X-Bz-Content-Sha1": sha1_hex(data),
                 "Authorization": upload.authorization_token,
                 **settings.headers
             },
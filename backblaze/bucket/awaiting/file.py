@@ -24,6 +24,8 @@ if TYPE_CHECKING:
 
 
 class AwaitingFile(BaseFile):
+    __slots__ = ()
+
     _context: "Awaiting"
 
     def parts(self, part_number: int = 0) -> AwaitingParts:
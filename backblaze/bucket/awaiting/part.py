@@ -1,10 +1,19 @@
-from aiofile import AIOFile, Reader
-from hashlib import sha1
-from typing import cast, AsyncGenerator, TYPE_CHECKING, Tuple
+import os
+import asyncio
+
+from typing import (
+    cast,
+    AsyncGenerator,
+    AsyncIterator,
+    BinaryIO,
+    TYPE_CHECKING,
+    Tuple,
+    Union
+)
 
 from ..base import BasePart
 
-from ...models.file import PartModel, FileModel
+from ...models.file import PartModel, FileModel, UploadUrlModel
 
 from ...settings import CopyPartSettings
 
@@ -12,12 +21,90 @@ from ...utils import UploadUrlCache
 
 from ...decorators import authorize_required
 
+from ...hash import sha1, sha1_hex
+
 if TYPE_CHECKING:
     from ... import Awaiting
     from .file import AwaitingFile
 
 
+HASH_PIECE_SIZE = 262144
+HEX_DIGITS_AT_END_SIZE = 100000000
+
+
+def _read_chunk(fp: BinaryIO, buf: bytearray) -> Tuple[memoryview, str]:
+    """Reads a chunk into buf, hashing each piece as it's read.
+
+    Parameters
+    ----------
+    fp : BinaryIO
+        Unbuffered file to read from.
+    buf : bytearray
+        Buffer of chunk_size to read into.
+
+    Returns
+    -------
+    memoryview
+        View over the read part of buf, empty if end of file reached.
+    str
+        Hex SHA1 of chunk.
+    """
+
+    view = memoryview(buf)
+    hashed = sha1()
+    read = 0
+
+    while read < len(buf):
+        piece = fp.readinto(view[read:read + HASH_PIECE_SIZE])
+        if not piece:
+            break
+
+        hashed.update(view[read:read + piece])
+        read += piece
+
+    return view[:read], hashed.hexdigest()
+
+
+class _ViewStream:
+    """Used to upload a memoryview without copying it into bytes,
+    can be iterated more then once so requests can be retried.
+    """
+
+    def __init__(self, view: memoryview) -> None:
+        self._view = view
+
+    async def __aiter__(self) -> AsyncIterator[memoryview]:
+        yield self._view
+
+
+class _HashingStream:
+    """Used to upload data while hashing it, the hex SHA1
+    is sent as the last 40 bytes for hex_digits_at_end.
+    """
+
+    def __init__(self, data: Union[bytes, memoryview]) -> None:
+        self._data = data
+        self.sha1_str = ""
+
+    def __len__(self) -> int:
+        return len(self._data) + 40
+
+    async def __aiter__(self) -> AsyncIterator[Union[bytes, memoryview]]:
+        view = memoryview(self._data)
+        hashed = sha1()
+
+        for index in range(0, len(view), HASH_PIECE_SIZE):
+            piece = view[index:index + HASH_PIECE_SIZE]
+            hashed.update(piece)
+            yield piece
+
+        self.sha1_str = hashed.hexdigest()
+        yield self.sha1_str.encode()
+
+
 class AwaitingParts(BasePart):
+    __slots__ = ()
+
     _context: "Awaiting"
     _file: "AwaitingFile"
 
@@ -26,31 +113,61 @@ class AwaitingParts(BasePart):
                    ) -> AsyncGenerator[Tuple[PartModel, int], None]:
         """Used to list parts.
 
+        Parameters
+        ----------
+        limit : int, optional
+            Parts fetched per request, by default 100
+
         Yields
         -------
         PartModel
         int
             Next part number.
-        limit : int
-            Part limit.
+
+        Notes
+        -----
+        Every page is listed, the next page is fetched
+        while the current one is being iterated.
         """
 
-        data = cast(
-            dict,
-            await self._context._post(
-                json={
-                    "fileId": self._file.file_id,
-                    "startPartNumber":
-                    self.part_number if self.part_number > 0 else 1,
-                    "maxPartCount": limit
-                },
-                include_account=False,
-                url=self._context._routes.file.list_parts
+        async def _page(start_part_number: int) -> dict:
+            return cast(
+                dict,
+                await self._context._post(
+                    json={
+                        "fileId": self._file.file_id,
+                        "startPartNumber": start_part_number,
+                        "maxPartCount": limit
+                    },
+                    include_account=False,
+                    url=self._context._list_parts_url
+                )
             )
+
+        next_page = asyncio.create_task(
+            _page(self.part_number if self.part_number > 0 else 1)
         )
 
-        for part in data["parts"]:
-            yield PartModel(part), data["nextPartNumber"]
+        try:
+            while next_page:
+                data = await next_page
+
+                next_part_number = data["nextPartNumber"]
+                if next_part_number:
+                    next_page = asyncio.create_task(_page(next_part_number))
+                else:
+                    next_page = None
+
+                for part in data["parts"]:
+                    yield PartModel(part), next_part_number
+        finally:
+            if next_page:
+                if next_page.done():
+                    # Retrieved so a failed prefetch isn't logged.
+                    if not next_page.cancelled():
+                        next_page.exception()
+                else:
+                    next_page.cancel()
 
     @authorize_required
     async def copy(self, settings: CopyPartSettings) -> PartModel:
@@ -66,7 +183,7 @@ class AwaitingParts(BasePart):
         """
 
         return PartModel(await self._context._post(
-            url=self._context._routes.file.copy_part,
+            url=self._context._copy_part_url,
             json={
                 "sourceFileId": self._file.file_id,
                 "partNumber":
@@ -77,12 +194,12 @@ class AwaitingParts(BasePart):
         ))
 
     @authorize_required
-    async def data(self, data: bytes) -> PartModel:
+    async def data(self, data: Union[bytes, memoryview]) -> PartModel:
         """Uploads a part.
 
         Parameters
         ----------
-        data : bytes
+        data : Union[bytes, memoryview]
 
         Returns
         -------
@@ -92,25 +209,113 @@ class AwaitingParts(BasePart):
 
         self.part_number += 1
 
-        upload = await self._file.upload_url()
+        return await self._upload_one(data, self.part_number)
+
+    async def _upload_one(self, data: Union[bytes, memoryview],
+                          part_number: int) -> PartModel:
+        """Uploads a part under a pre-assigned part number.
+
+        Parameters
+        ----------
+        data : Union[bytes, memoryview]
+        part_number : int
+
+        Returns
+        -------
+        PartModel
+            Holds details on upload part.
+        """
+
+        if len(data) > HEX_DIGITS_AT_END_SIZE:
+            # Large parts are hashed while uploading instead of before.
+            return await self._upload_with_hash(
+                _HashingStream(data), part_number, "hex_digits_at_end"
+            )
+
+        # Hashed in a thread so the event loop isn't blocked.
+        sha1_str = await asyncio.get_running_loop().run_in_executor(
+            None, sha1_hex, data
+        )
+
+        return await self._upload_with_hash(data, part_number, sha1_str)
+
+    async def _new_upload_url(self) -> UploadUrlModel:
+        """Used to get an upload URL which isn't cached.
+
+        Returns
+        -------
+        UploadUrlModel
+            Holds details on the upload URL.
+
+        Notes
+        -----
+        B2 requires a different upload URL for each
+        part being uploaded at the same time.
+        """
+
+        return UploadUrlModel(
+            await self._context._post(
+                url=self._context._routes.upload.upload_part,
+                json={
+                    "fileId": self._file.file_id
+                },
+                include_account=False
+            )
+        )
+
+    async def _upload_with_hash(self,
+                                data: Union[bytes, memoryview,
+                                            _HashingStream],
+                                part_number: int,
+                                sha1_str: str,
+                                upload: UploadUrlModel = None
+                                ) -> PartModel:
+        """Uploads a part with an already computed SHA1.
+
+        Parameters
+        ----------
+        data : Union[bytes, memoryview, _HashingStream]
+        part_number : int
+        sha1_str : str
+            Hex SHA1 of data, or hex_digits_at_end for _HashingStream.
+        upload : UploadUrlModel, optional
+            Upload URL to use, by default the file's cached one.
+
+        Returns
+        -------
+        PartModel
+            Holds details on upload part.
+        """
+
+        if upload is None:
+            upload = await self._file.upload_url()
 
-        sha1_str = sha1(data).hexdigest()
-        self.sha1s_append(sha1_str)
+        if isinstance(data, memoryview):
+            content = _ViewStream(data)
+        else:
+            content = data
 
-        return PartModel(
+        part = PartModel(
             await self._context._post(
                 headers={
                     "Content-Length": str(len(data)),
-                    "X-Bz-Part-Number": str(self.part_number),
+                    "X-Bz-Part-Number": str(part_number),
                     "X-Bz-Content-Sha1": sha1_str,
                     "Authorization": upload.authorization_token
                 },
                 include_account=False,
                 url=upload.upload_url,
-                data=data
+                content=content
             )
         )
 
+        self._set_sha1(
+            part_number,
+            data.sha1_str if isinstance(data, _HashingStream) else sha1_str
+        )
+
+        return part
+
     async def file(self, pathway: str) -> None:
         """Used to upload a file in parts.
 
@@ -118,12 +323,99 @@ class AwaitingParts(BasePart):
         ----------
         pathway : str
             Local file pathway.
+
+        Notes
+        -----
+        Up to max_concurrent_parts parts are uploaded at once,
+        chunk buffers are reused between parts.
+
+        Each part being uploaded checks out its own upload URL,
+        URLs are reused by later parts unless their upload failed.
         """
 
-        async with AIOFile(pathway, "rb") as afp:
-            async for chunk in Reader(afp,
-                                      chunk_size=self._context.chunk_size):
-                await self.data(chunk)
+        sem = asyncio.Semaphore(self._context.max_concurrent_parts)
+        buffers = []
+        upload_urls = []
+        failed = False
+
+        async def _bounded_upload(buf: bytearray, chunk: memoryview,
+                                  part_number: int,
+                                  sha1_str: str) -> PartModel:
+            nonlocal failed
+
+            try:
+                upload = upload_urls.pop() if upload_urls \
+                    else await self._new_upload_url()
+
+                part = await self._upload_with_hash(
+                    chunk, part_number, sha1_str, upload
+                )
+
+                # Only returned once the upload has succeeded,
+                # B2 wants a new URL after an error or a 503.
+                upload_urls.append(upload)
+
+                return part
+            except Exception:
+                failed = True
+                raise
+            finally:
+                buffers.append(buf)
+                sem.release()
+
+        loop = asyncio.get_running_loop()
+        fp = open(pathway, "rb", buffering=0)
+
+        tasks = []
+        read = None
+        try:
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(fp.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+            while True:
+                # Acquired before reading so only a bounded
+                # amount of chunks are held in memory.
+                await sem.acquire()
+
+                # Stops reading once a part has failed,
+                # gather raises the part's error.
+                if failed:
+                    sem.release()
+                    break
+
+                buf = buffers.pop() if buffers \
+                    else bytearray(self._context.chunk_size)
+
+                # Read & hashed in a thread straight into buf,
+                # shielded so a cancel doesn't abandon the read.
+                read = loop.run_in_executor(None, _read_chunk, fp, buf)
+                chunk, sha1_str = await asyncio.shield(read)
+                read = None
+
+                if not chunk:
+                    sem.release()
+                    break
+
+                self.part_number += 1
+                tasks.append(asyncio.create_task(
+                    _bounded_upload(
+                        buf, chunk, self.part_number, sha1_str
+                    )
+                ))
+
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        finally:
+            # fp can't be closed while a thread is reading it.
+            if read is not None:
+                await asyncio.wait([read])
+
+            fp.close()
 
     @authorize_required
     async def finish(self) -> FileModel:
@@ -142,7 +434,7 @@ class AwaitingParts(BasePart):
 
         return FileModel(
             await self._context._post(
-                url=self._context._routes.file.finish_large,
+                url=self._context._finish_large_url,
                 json={
                     "fileId": self._file.file_id,
                     "partSha1Array": self.sha1s
@@ -8,6 +8,9 @@ if TYPE_CHECKING:
 
 
 class BaseBucket:
+    # __weakref__ is needed for the client's bucket cache.
+    __slots__ = ("_context", "bucket_id", "__weakref__")
+
     def __init__(self, _context: Union["Awaiting", "Blocking"],
                  bucket_id: str) -> None:
         self._context = _context
@@ -15,6 +18,8 @@ class BaseBucket:
 
 
 class BaseFile(BaseBucket):
+    __slots__ = ("file_id",)
+
     def __init__(self, file_id: str, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
 
@@ -22,6 +27,16 @@ class BaseFile(BaseBucket):
 
 
 class BasePart:
+    __slots__ = (
+        "_file",
+        "_context",
+        "part_number",
+        "_sha1s",
+        "_sha1_count"
+    )
+
+    _sha1s_capacity = 64
+
     def __init__(self,
                  file: Union["AwaitingFile", "BlockingFile"],
                  _context: Union["Awaiting", "Blocking"],
@@ -30,5 +45,61 @@ class BasePart:
         self._file = file
         self._context = _context
         self.part_number = part_number
-        self.sha1s = []
-        self.sha1s_append = self.sha1s.append
+        self._sha1s = [None] * self._sha1s_capacity
+        self._sha1_count = 0
+
+    @property
+    def sha1s(self) -> list:
+        """SHA1s of uploaded parts ordered by part number.
+
+        Returns
+        -------
+        list
+        """
+
+        return self._sha1s[:self._sha1_count]
+
+    @sha1s.setter
+    def sha1s(self, sha1s: list) -> None:
+        """Replaces the SHA1s, e.g. with ones saved from a previous run.
+
+        Parameters
+        ----------
+        sha1s : list
+        """
+
+        self._sha1s = list(sha1s) + [None] * self._sha1s_capacity
+        self._sha1_count = len(sha1s)
+
+    def sha1s_append(self, sha1_str: str) -> None:
+        """Used to add the SHA1 of the first part without one.
+
+        Parameters
+        ----------
+        sha1_str : str
+        """
+
+        try:
+            index = self._sha1s.index(None)
+        except ValueError:
+            index = len(self._sha1s)
+
+        self._set_sha1(index + 1, sha1_str)
+
+    def _set_sha1(self, part_number: int, sha1_str: str) -> None:
+        """Used to store a part's SHA1 by its part number.
+
+        Parameters
+        ----------
+        part_number : int
+        sha1_str : str
+        """
+
+        index = part_number - 1
+
+        while index >= len(self._sha1s):
+            self._sha1s.extend([None] * len(self._sha1s))
+
+        self._sha1s[index] = sha1_str
+        if index >= self._sha1_count:
+            self._sha1_count = index + 1
@@ -1,6 +1,5 @@
 import os
 
-from hashlib import sha1
 from typing import Tuple, Generator, TYPE_CHECKING, cast
 
 from ..base import BaseBucket
@@ -21,11 +20,15 @@ from ...utils import UploadUrlCache
 
 from ...decorators import authorize_required
 
+from ...hash import sha1_hex
+
 if TYPE_CHECKING:
     from ... import Blocking
 
 
 class BlockingBucket(BaseBucket):
+    __slots__ = ()
+
     _context: "Blocking"
 
     @authorize_required
@@ -241,7 +244,7 @@ class BlockingBucket(BaseBucket):
             url=upload.upload_url,
             headers={
                 "Content-Length": str(len(data)),
-                "X-Bz-Content-Sha1": sha1(data).hexdigest(),
+                "X-Bz-Content-Sha1": sha1_hex(data),
                 "Authorization": upload.authorization_token,
                 **settings.headers
             },
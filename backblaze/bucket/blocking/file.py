@@ -21,6 +21,8 @@ from ...decorators import authorize_required
 
 
 class BlockingFile(BaseFile):
+    __slots__ = ()
+
     def parts(self, part_number: int = 0) -> BlockingParts:
         """Used to upload a parts.
 
@@ -1,4 +1,3 @@
-from hashlib import sha1
 from typing import Generator, Tuple, cast, TYPE_CHECKING
 
 from ..base import BasePart
@@ -11,45 +10,72 @@ from ...utils import UploadUrlCache
 
 from ...decorators import authorize_required
 
+from ...hash import sha1_hex
+
 if TYPE_CHECKING:
     from ... import Blocking
     from .file import BlockingFile
 
 
 class BlockingParts(BasePart):
+    __slots__ = ("_headers",)
+
     _context: "Blocking"
     _file: "BlockingFile"
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        # Parts are uploaded one at a time, so one
+        # headers dict is filled in for every part.
+        self._headers = {
+            "Content-Length": "",
+            "X-Bz-Part-Number": "",
+            "X-Bz-Content-Sha1": "",
+            "Authorization": ""
+        }
+
     @authorize_required
     def list(self, limit: int = 100
              ) -> Generator[Tuple[PartModel, int], int, None]:
         """Used to list parts.
 
+        Parameters
+        ----------
+        limit : int, optional
+            Parts fetched per request, by default 100
+
         Yields
         -------
         PartModel
         int
             Next part number.
-        limit : int
-            Part limit.
+
+        Notes
+        -----
+        Every page is listed.
         """
 
-        data = cast(
-            dict,
-            self._context._post(
-                json={
-                    "fileId": self._file.file_id,
-                    "startPartNumber":
-                    self.part_number if self.part_number > 0 else 1,
-                    "maxPartCount": limit
-                },
-                include_account=False,
-                url=self._context._routes.file.list_parts
+        next_part_number = self.part_number if self.part_number > 0 else 1
+
+        while next_part_number:
+            data = cast(
+                dict,
+                self._context._post(
+                    json={
+                        "fileId": self._file.file_id,
+                        "startPartNumber": next_part_number,
+                        "maxPartCount": limit
+                    },
+                    include_account=False,
+                    url=self._context._list_parts_url
+                )
             )
-        )
 
-        for part in data["parts"]:
-            yield PartModel(part), data["nextPartNumber"]
+            next_part_number = data["nextPartNumber"]
+
+            for part in data["parts"]:
+                yield PartModel(part), next_part_number
 
     @authorize_required
     def copy(self, settings: CopyPartSettings) -> PartModel:
@@ -65,7 +91,7 @@ class BlockingParts(BasePart):
         """
 
         return PartModel(self._context._post(
-            url=self._context._routes.file.copy_part,
+            url=self._context._copy_part_url,
             json={
                 "sourceFileId": self._file.file_id,
                 "partNumber":
@@ -93,17 +119,18 @@ class BlockingParts(BasePart):
 
         upload = self._file.upload_url()
 
-        sha1_str = sha1(data).hexdigest()
-        self.sha1s_append(sha1_str)
+        sha1_str = sha1_hex(data)
+        self._set_sha1(self.part_number, sha1_str)
+
+        headers = self._headers
+        headers["Content-Length"] = str(len(data))
+        headers["X-Bz-Part-Number"] = str(self.part_number)
+        headers["X-Bz-Content-Sha1"] = sha1_str
+        headers["Authorization"] = upload.authorization_token
 
         return PartModel(
             self._context._post(
-                headers={
-                    "Content-Length": str(len(data)),
-                    "X-Bz-Part-Number": str(self.part_number),
-                    "X-Bz-Content-Sha1": sha1_str,
-                    "Authorization": upload.authorization_token
-                },
+                headers=headers,
                 include_account=False,
                 url=upload.upload_url,
                 data=data
@@ -144,7 +171,7 @@ class BlockingParts(BasePart):
 
         return FileModel(
             self._context._post(
-                url=self._context._routes.file.finish_large,
+                url=self._context._finish_large_url,
                 json={
                     "fileId": self._file.file_id,
                     "partSha1Array": self.sha1s
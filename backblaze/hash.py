@@ -0,0 +1,49 @@
+import hashlib
+
+from sys import version_info
+from typing import Any, Union
+
+
+if version_info >= (3, 9):
+    def sha1(data: Union[bytes, memoryview] = b"") -> Any:
+        """Used to create a SHA1 hash object.
+
+        Parameters
+        ----------
+        data : Union[bytes, memoryview], optional
+            by default b""
+
+        Returns
+        -------
+        Any
+            hashlib SHA1 object.
+
+        Notes
+        -----
+        Marked as not used for security so OpenSSL's
+        implementation is still used on FIPS builds.
+        """
+
+        return hashlib.sha1(data, usedforsecurity=False)
+else:
+    sha1 = hashlib.sha1
+
+
+def sha1_hex(data: Union[bytes, memoryview]) -> str:
+    """Used to get the hex SHA1 of data.
+
+    Parameters
+    ----------
+    data : Union[bytes, memoryview]
+
+    Returns
+    -------
+    str
+
+    Notes
+    -----
+    hashlib uses OpenSSL, what picks the fastest SHA1
+    the CPU supports (e.g. SHA-NI) & releases the GIL.
+    """
+
+    return sha1(data).hexdigest()
@@ -1,4 +1,4 @@
-from typing import AsyncGenerator, Callable, Union
+from typing import AsyncGenerator, Callable, Optional, Union
 from asyncio import sleep
 from httpx import AsyncClient
 
@@ -10,6 +10,14 @@ class AwaitingHTTP(BaseHTTP):
     authorize: Callable
     account_id: str
     _client: AsyncClient
+    _share_client: bool
+    _auth_header: Optional[str]
+
+    def __with_auth(self, headers: Optional[dict]) -> Optional[dict]:
+        if not self._share_client:
+            return headers
+
+        return {"Authorization": self._auth_header, **(headers or {})}
 
     async def __handle(self, request, resp_json: bool = True,
                        include_account: bool = True,
@@ -21,7 +29,15 @@ class AwaitingHTTP(BaseHTTP):
             else:
                 kwargs["json"] = {"accountId": self.account_id}
 
+        if "json" in kwargs:
+            self._encode_json(kwargs)
+
+        headers = kwargs.get("headers")
+
         for _ in range(0, 3):
+            # Re-read each attempt as a 401 refreshes the token.
+            kwargs["headers"] = self.__with_auth(headers)
+
             resp = await request(*args, **kwargs)
             if resp.status_code == 401:
                 await self.authorize()
@@ -61,6 +77,8 @@ class AwaitingHTTP(BaseHTTP):
         )
 
     async def _stream(self, *args, **kwargs) -> AsyncGenerator[bytes, None]:
+        kwargs["headers"] = self.__with_auth(kwargs.get("headers"))
+
         async with self._client.stream(  # type: ignore
                 "GET", *args, **kwargs) as resp:
             resp.raise_for_status()
@@ -1,3 +1,4 @@
+import gzip
 import logging
 
 from json import JSONDecodeError
@@ -5,6 +6,7 @@ from typing import Union
 
 from httpx import Response
 
+from ..utils import json_dumps, json_loads
 from ..exceptions import (
     BadRequest,
     UnAuthorized,
@@ -26,8 +28,35 @@ HTTP_ERRORS = {
     503: ServiceUnavailable
 }
 
+COMPRESS_THRESHOLD = 1024
+
 
 class BaseHTTP:
+    _compress_requests: bool
+
+    def _encode_json(self, kwargs: dict) -> None:
+        """Serializes the json kwarg into request content,
+        gzipping it if large enough & compression is enabled.
+
+        Parameters
+        ----------
+        kwargs : dict
+            Request kwargs, modified in place.
+        """
+
+        content = json_dumps(kwargs.pop("json"))
+        headers = {
+            **(kwargs.get("headers") or {}),
+            "Content-Type": "application/json"
+        }
+
+        if self._compress_requests and len(content) > COMPRESS_THRESHOLD:
+            content = gzip.compress(content, compresslevel=1)
+            headers["Content-Encoding"] = "gzip"
+
+        kwargs["content"] = content
+        kwargs["headers"] = headers
+
     def handle_resp(self, resp: Response, json: bool = True
                     ) -> Union[dict, bytes, None]:
         """Handles resp response.
@@ -53,7 +82,7 @@ class BaseHTTP:
 
         if resp.status_code not in HTTP_ERRORS:
             if json:
-                return resp.json()
+                return json_loads(resp.read())
             else:
                 return resp.read()
         else:
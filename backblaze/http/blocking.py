@@ -21,6 +21,9 @@ class BlockingHTTP(BaseHTTP):
             else:
                 kwargs["json"] = {"accountId": self.account_id}
 
+        if "json" in kwargs:
+            self._encode_json(kwargs)
+
         for _ in range(0, 3):
             resp = request(*args, **kwargs)
             if resp.status_code == 401:
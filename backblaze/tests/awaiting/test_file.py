@@ -83,6 +83,10 @@ class TestAwaitingFile(asynctest.TestCase):
         async for part, _ in file.parts().list():
             self.assertIsInstance(part, PartModel)
 
+        # One part per page, so every page has to be followed.
+        listed = [part async for part, _ in file.parts().list(limit=1)]
+        self.assertEqual(len(listed), parts.part_number)
+
         await parts.finish()
 
         await file.delete(details.file_name)
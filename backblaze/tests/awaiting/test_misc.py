@@ -1,3 +1,4 @@
+import asyncio
 import asynctest
 
 from ...exceptions import AuthorizeRequired
@@ -11,3 +12,39 @@ class TestMiscBlocking(asynctest.TestCase):
 
         with self.assertRaises(AuthorizeRequired):
             await b2_client.download_by_name("", "")
+
+    async def test_context_manager(self):
+        async with AwaitingClient("", "") as b2_client:
+            self.assertFalse(b2_client._client.is_closed)
+
+        self.assertTrue(b2_client._client.is_closed)
+
+    async def test_shared_client(self):
+        first = AwaitingClient("", "", share_client=True)
+        second = AwaitingClient("", "", share_client=True)
+
+        self.assertIs(first._client, second._client)
+
+        # Closing a client twice only releases its own reference.
+        async with first:
+            await first.close()
+
+        self.assertFalse(second._client.is_closed)
+
+        await second.close()
+
+        self.assertTrue(second._client.is_closed)
+
+    async def test_close_after_failed_refresh(self):
+        b2_client = AwaitingClient("", "")
+
+        async def failed_refresh():
+            raise ConnectionError()
+
+        b2_client._refresh_task = asyncio.create_task(failed_refresh())
+        await asyncio.sleep(0)
+
+        await b2_client.close()
+
+        self.assertIsNone(b2_client._refresh_task)
+        self.assertTrue(b2_client._client.is_closed)
@@ -78,6 +78,10 @@ class TestBlockingFile(unittest.TestCase):
         for part, _ in file.parts().list():
             self.assertIsInstance(part, PartModel)
 
+        # One part per page, so every page has to be followed.
+        listed = [part for part, _ in file.parts().list(limit=1)]
+        self.assertEqual(len(listed), parts.part_number)
+
         parts.finish()
 
         file.delete(details.file_name)
@@ -1,7 +1,11 @@
+import gzip
+import json
 import unittest
 
 from ...exceptions import AuthorizeRequired
 
+from ...bucket.base import BasePart
+
 from ... import Blocking as BlockingClient
 
 
@@ -11,3 +15,42 @@ class TestMiscBlocking(unittest.TestCase):
 
         with self.assertRaises(AuthorizeRequired):
             b2_client.download_by_name("", "")
+
+    def test_resumed_part_sha1s(self):
+        parts = BasePart(None, None, 2)
+
+        parts.sha1s_append("part1")
+        parts.sha1s_append("part2")
+        parts._set_sha1(3, "part3")
+
+        self.assertEqual(parts.sha1s, ["part1", "part2", "part3"])
+
+        parts.sha1s = ["part1"]
+        parts.sha1s_append("part2")
+
+        self.assertEqual(parts.sha1s, ["part1", "part2"])
+
+    def test_context_manager(self):
+        with BlockingClient("", "") as b2_client:
+            self.assertFalse(b2_client._client.is_closed)
+
+        self.assertTrue(b2_client._client.is_closed)
+
+    def test_compress_requests(self):
+        b2_client = BlockingClient("", "", compress_requests=True)
+
+        small = {"json": {"fileId": ""}}
+        b2_client._encode_json(small)
+
+        self.assertNotIn("Content-Encoding", small["headers"])
+
+        large = {"json": {"partSha1Array": ["0" * 40] * 100}}
+        b2_client._encode_json(large)
+
+        self.assertEqual(large["headers"]["Content-Encoding"], "gzip")
+        self.assertEqual(
+            json.loads(gzip.decompress(large["content"])),
+            {"partSha1Array": ["0" * 40] * 100}
+        )
+
+        b2_client.close()
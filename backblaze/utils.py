@@ -1,5 +1,12 @@
+import json
+
 from datetime import datetime, timedelta
-from typing import Union
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from .models.file import UploadUrlModel
 
@@ -105,3 +112,39 @@ def encode_name(name: str, encoding: str = "utf-8",
         name = name.replace(" ", "-")
 
     return name.encode(encoding).decode(encoding)
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Used to serialize JSON, orjson is used if installed.
+
+    Parameters
+    ----------
+    obj : Any
+
+    Returns
+    -------
+    bytes
+    """
+
+    if orjson:
+        return orjson.dumps(obj)
+
+    return json.dumps(obj).encode("utf-8")
+
+
+def json_loads(data: bytes) -> Any:
+    """Used to deserialize JSON, orjson is used if installed.
+
+    Parameters
+    ----------
+    data : bytes
+
+    Returns
+    -------
+    Any
+    """
+
+    if orjson:
+        return orjson.loads(data)
+
+    return json.loads(data)
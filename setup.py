@@ -31,6 +31,9 @@ setup(
     author=get_variable("__author__"),
     author_email=get_variable("__author_email__"),
     install_requires=get_requirements(),
+    extras_require={
+        "orjson": ["orjson"]
+    },
     license=get_variable("__license__"),
     packages=[
         "backblaze",